@@ -0,0 +1,664 @@
+"""
+CircuitPython Useless Box
+Reads GPIO 4 (toggle switch) and GPIO 5 (microswitch)
+Controls DC motor on GPIO 14 and GPIO 15
+Controls Christmas lights via GPIO 16
+Controls soundboard via GPIO 17-21
+
+Wiring Notes:
+- GPIO 4 (Toggle Switch): 6-pin 3-state toggle switch
+- GPIO 5 (Microswitch): Roller style microswitch
+- GPIO 14 & 15: DC motor direction + speed via hardware PWM (R_en and L_en are hardwired HIGH)
+- GPIO 16: LED control (via transistor/MOSFET)
+  - Connect GPIO 16 -> Transistor base/gate
+  - Connect LEDs + -> 3V3 (or external 3V supply)
+  - Connect LEDs - -> Transistor collector/drain
+  - Connect Transistor emitter/source -> GND
+- GPIO 19-26: Soundboard triggers (IO1-IO5)
+  - GPIO 21 -> Soundboard IO1 (Christmas bells - plays when toggle ON)
+  - GPIO 26 -> Soundboard IO2 (Grinch voice - random when toggle OFF)
+  - GPIO 22 -> Soundboard IO3 (Grinch voice - random when toggle OFF)
+  - GPIO 20 -> Soundboard IO4 (Grinch voice - random when toggle OFF)
+  - GPIO 19 -> Soundboard IO5 (Grinch voice - random when toggle OFF)
+  - Soundboard triggers by shorting IO pin to GND
+  - Pico pins normally HIGH, pull LOW briefly to trigger
+"""
+
+import board
+import gc
+import digitalio
+import keypad
+import pwmio
+import time
+import random
+import supervisor
+from micropython import const
+
+# ============================================================================
+# GPIO Configuration
+# ============================================================================
+
+# GPIO 4 - Toggle Switch (was labeled as microswitch, but is actually toggle)
+# GPIO 5 - Microswitch (was labeled as toggle switch, but is actually microswitch)
+# Both are scanned in the background by keypad, which debounces them and queues
+# an event for every edge, so the main loop never has to poll the pins.
+# value_when_pressed=False keeps the internal pull-ups, so a keypad "pressed"
+# event means the pin went LOW and a "released" event means it went HIGH.
+# Note: the microswitch reads HIGH when pressed with this wiring (likely NC) -
+# if yours reads the other way round, swap the microswitch handlers in main()
+TOGGLE_KEY = 0
+MICROSWITCH_KEY = 1
+SWITCH_SCAN_INTERVAL = 0.02  # seconds between keypad scans (also the debounce time)
+switches = keypad.Keys((board.GP4, board.GP5), value_when_pressed=False, pull=True,
+                       interval=SWITCH_SCAN_INTERVAL)
+
+# GPIO 16 - Christmas Lights Control (via transistor)
+# HIGH = lights ON, LOW = lights OFF
+christmas_lights = digitalio.DigitalInOut(board.GP16)
+christmas_lights.direction = digitalio.Direction.OUTPUT
+christmas_lights.value = False  # Start with lights OFF
+
+# GPIO 19-26 - Soundboard Triggers (IO1-IO5)
+# Soundboard triggers by shorting IO pin to GND
+# Pico pins: HIGH = not triggering, LOW = trigger sound
+# IO1 = Christmas bells (plays when toggle ON) - GP21
+# IO2-IO5 = Grinch voice (random when toggle OFF)
+soundboard_io1 = digitalio.DigitalInOut(board.GP21)  # Christmas bells
+soundboard_io1.direction = digitalio.Direction.OUTPUT
+soundboard_io1.value = True  # HIGH = not triggering
+
+soundboard_io2 = digitalio.DigitalInOut(board.GP26)  # Grinch voice 1
+soundboard_io2.direction = digitalio.Direction.OUTPUT
+soundboard_io2.value = True
+
+soundboard_io3 = digitalio.DigitalInOut(board.GP22)  # Grinch voice 2
+soundboard_io3.direction = digitalio.Direction.OUTPUT
+soundboard_io3.value = True
+
+soundboard_io4 = digitalio.DigitalInOut(board.GP20)  # Grinch voice 3
+soundboard_io4.direction = digitalio.Direction.OUTPUT
+soundboard_io4.value = True
+
+soundboard_io5 = digitalio.DigitalInOut(board.GP19)  # Grinch voice 4
+soundboard_io5.direction = digitalio.Direction.OUTPUT
+soundboard_io5.value = True
+
+# Store all Grinch voice pins in a list for random selection
+grinch_voice_pins = [soundboard_io2, soundboard_io3, soundboard_io4, soundboard_io5]
+
+# Soundboard control - set to False to disable sounds if power issues
+ENABLE_SOUNDS = True  # Set to False to disable all soundboard triggers
+
+# Serial debug output - set to True to watch state changes with `make monitor`
+# Off by default: every print builds a new string and blocks on the USB serial port
+DEBUG = False
+
+# Motor speed control using the RP2040's hardware PWM (no CPU cost once set)
+# Set USE_SPEED_CONTROL to False for full speed, True for controlled speed
+USE_SPEED_CONTROL = False  # DISABLED: Full power needed to push through toggle switch resistance
+
+# Adjust these values to control motor speed (only used if USE_SPEED_CONTROL = True)
+# Only their ratio matters - it sets the PWM duty cycle
+MOTOR_ON_TIME = 0.020   # Time motor is ON (seconds) - lower = slower
+MOTOR_OFF_TIME = 0.005  # Time motor is OFF (seconds) - higher = slower
+# Effective speed = MOTOR_ON_TIME / (MOTOR_ON_TIME + MOTOR_OFF_TIME)
+# Example: 0.020 / (0.020 + 0.005) = ~80% speed (high torque for pushing toggle)
+
+# PWM carrier frequency - 20kHz is above hearing range, so the motor doesn't whine
+MOTOR_PWM_FREQUENCY = 20000
+
+# Random delay before motor starts (after toggle is turned on)
+DELAY_MIN = 0.5   # Minimum delay in seconds
+DELAY_MAX = 1.5   # Maximum delay in seconds
+
+# Random pause during extension (mischievous behavior)
+PAUSE_PROBABILITY = 0.3  # 30% chance to pause halfway (0.0 = never, 1.0 = always)
+PAUSE_AFTER_TIME = 0.08  # Pause after this many seconds of extending (very early, right after movement starts)
+PAUSE_DELAY_MIN = 1.0   # Minimum pause time in seconds (increased for more noticeable pause)
+PAUSE_DELAY_MAX = 2.0   # Maximum pause time in seconds (increased for more noticeable pause)
+
+# Brief stop between hitting the toggle and reversing, so the motor isn't slammed backwards
+REVERSE_DELAY = 0.2  # seconds
+
+# Delay and pause timings in integer milliseconds for supervisor.ticks_ms() math
+# (ticks_ms() returns a small int, so unlike time.monotonic() it never allocates a float)
+DELAY_MIN_MS = int(DELAY_MIN * 1000)
+DELAY_MAX_MS = int(DELAY_MAX * 1000)
+PAUSE_AFTER_MS = int(PAUSE_AFTER_TIME * 1000)
+PAUSE_DELAY_MIN_MS = int(PAUSE_DELAY_MIN * 1000)
+PAUSE_DELAY_MAX_MS = int(PAUSE_DELAY_MAX * 1000)
+REVERSE_DELAY_MS = int(REVERSE_DELAY * 1000)
+
+# Random choices for each cycle are drawn ahead of time into tables of this size
+# (must be a power of two) instead of calling random on every cycle
+RANDOM_TABLE_SIZE = const(32)
+
+# ticks_ms() wraps around every 2**29 ms - mask differences with this to stay wrap-safe
+TICKS_MASK = const(0x1FFFFFFF)
+# Half the ticks period: `((deadline - now + TICKS_HALF) & TICKS_MASK) - TICKS_HALF`
+# is the signed ms left until a deadline (<= 0 once it has passed), even across a wrap
+TICKS_HALF = const(0x10000000)
+
+# Main loop period while the arm is moving - keypad only reports an edge once per
+# scan, so waking more often than that can't react to the arm any sooner. The
+# pause start/end get their own wakeup exactly when they're due.
+LOOP_DELAY = SWITCH_SCAN_INTERVAL  # seconds
+LOOP_DELAY_MS = int(LOOP_DELAY * 1000)
+
+# Main loop period while idle - nothing is timed, we only wait for the toggle,
+# and the random start delay already dwarfs this extra reaction time
+IDLE_LOOP_DELAY = 0.1  # seconds
+
+# GPIO 14 & 15 - DC Motor Direction Control
+# Both pins are hardware PWM outputs: the driving pin gets MOTOR_DUTY, the other 0
+# GP14/GP15 are the A/B channels of the same RP2040 PWM slice, so they share one
+# frequency - keep it fixed (no variable_frequency) and only change duty cycles
+motor_pwm_a = pwmio.PWMOut(board.GP14, frequency=MOTOR_PWM_FREQUENCY, duty_cycle=0)
+motor_pwm_b = pwmio.PWMOut(board.GP15, frequency=MOTOR_PWM_FREQUENCY, duty_cycle=0)
+
+# Duty cycle applied while the motor runs (65535 = always on = full speed)
+if USE_SPEED_CONTROL:
+    MOTOR_DUTY = int(65535 * MOTOR_ON_TIME / (MOTOR_ON_TIME + MOTOR_OFF_TIME))
+else:
+    MOTOR_DUTY = 65535
+
+# ============================================================================
+# State Machine
+# ============================================================================
+
+# States for the useless box
+# const() ints are folded into the bytecode, so state checks are plain int compares
+IDLE = const(0)              # Motor stopped, waiting
+EXTENDING = const(1)         # Motor forward (extending finger)
+EXTENDING_PAUSED = const(2)  # Paused during extension (random behavior)
+RETRACTING = const(3)        # Motor reverse (retracting finger)
+REVERSE_PENDING = const(4)   # Motor stopped after hitting the toggle, about to retract
+
+# State names for debug output, indexed by state
+STATE_NAMES = ("IDLE", "EXTENDING", "EXTENDING_PAUSED", "RETRACTING", "REVERSE_PENDING")
+
+# States where the limit switch releasing is expected (built once, not per release)
+LIMIT_RELEASE_OK_STATES = (IDLE, EXTENDING, RETRACTING, REVERSE_PENDING)
+
+current_state = IDLE
+
+# Timing and pause tracking - deadlines are ticks_ms() values, computed once when
+# they're set so the loop only has to compare against them
+should_pause_this_cycle = False
+pause_at = None      # When this cycle's planned pause starts
+resume_at = None     # When the current pause ends
+pause_duration = 0   # Length of the current pause in ms (for debug output)
+reverse_at = None    # When the stopped motor starts retracting
+next_debug_at = 0    # When to next print "Still paused..." (DEBUG only)
+toggle_edge_at = 0   # When keypad saw the latest toggle edge (its event timestamp)
+
+# Pre-drawn random choices, one entry per cycle (see refill_random_tables)
+start_delays_ms = [0] * RANDOM_TABLE_SIZE
+pause_decisions = [False] * RANDOM_TABLE_SIZE
+pause_durations_ms = [0] * RANDOM_TABLE_SIZE
+random_index = 0
+
+# ============================================================================
+# Random Behavior
+# ============================================================================
+
+def refill_random_tables():
+    """
+    Draw the next RANDOM_TABLE_SIZE cycles' worth of random choices
+    Fills the existing lists in place, so nothing new is allocated
+    """
+    for i in range(RANDOM_TABLE_SIZE):
+        start_delays_ms[i] = random.randint(DELAY_MIN_MS, DELAY_MAX_MS)
+        pause_decisions[i] = random.random() < PAUSE_PROBABILITY
+        pause_durations_ms[i] = random.randint(PAUSE_DELAY_MIN_MS, PAUSE_DELAY_MAX_MS)
+
+# ============================================================================
+# Christmas Lights Control Functions
+# ============================================================================
+
+def lights_on():
+    """Turn Christmas lights ON"""
+    christmas_lights.value = True
+    if DEBUG:
+        print("[LIGHTS] Christmas lights ON")
+
+def lights_off():
+    """Turn Christmas lights OFF"""
+    christmas_lights.value = False
+    if DEBUG:
+        print("[LIGHTS] Christmas lights OFF")
+
+# ============================================================================
+# Soundboard Control Functions
+# ============================================================================
+
+def trigger_sound(pin, duration=0.1):
+    """
+    Trigger a soundboard sound by pulling pin LOW briefly
+    pin: The GPIO pin to trigger
+    duration: How long to hold LOW (seconds) - default 100ms should be enough
+    """
+    pin.value = False  # Pull LOW to trigger
+    time.sleep(duration)
+    pin.value = True   # Return to HIGH
+    if DEBUG:
+        print("[SOUND] Triggered sound on GPIO %s" % pin)
+
+def play_christmas_bells():
+    """Play Christmas bells sound (IO1) - always plays when toggle ON"""
+    if not ENABLE_SOUNDS:
+        return
+    trigger_sound(soundboard_io1)
+    if DEBUG:
+        print("[SOUND] 🎄 Christmas bells playing!")
+
+def play_random_grinch_voice():
+    """Play a random Grinch voice sound (IO2-IO5) - plays when toggle OFF"""
+    if not ENABLE_SOUNDS:
+        return
+    selected_pin = random.choice(grinch_voice_pins)
+    pin_number = {soundboard_io2: "GP26", soundboard_io3: "GP22", 
+                  soundboard_io4: "GP20", soundboard_io5: "GP19"}[selected_pin]
+    trigger_sound(selected_pin)
+    if DEBUG:
+        print("[SOUND] 🎭 Grinch voice playing! (%s)" % pin_number)
+
+# ============================================================================
+# Motor Control Functions
+# ============================================================================
+
+def motor_stop():
+    """Stop the motor (both pins LOW)"""
+    motor_pwm_a.duty_cycle = 0
+    motor_pwm_b.duty_cycle = 0
+
+def motor_forward():
+    """Run motor forward direction (extending arm)"""
+    motor_pwm_a.duty_cycle = 0
+    motor_pwm_b.duty_cycle = MOTOR_DUTY
+
+def motor_reverse():
+    """Run motor reverse direction (retracting arm)"""
+    motor_pwm_a.duty_cycle = MOTOR_DUTY
+    motor_pwm_b.duty_cycle = 0
+
+# ============================================================================
+# State Machine Logic
+# ============================================================================
+
+def set_state(new_state):
+    """Change state and print status"""
+    global current_state
+    if current_state != new_state:
+        if DEBUG:
+            print("[STATE CHANGE] %s -> %s" % (STATE_NAMES[current_state], STATE_NAMES[new_state]))
+        current_state = new_state
+
+def reset_timing():
+    """Forget this cycle's extension/pause timing (arm stopped or reversing)"""
+    global should_pause_this_cycle, pause_at, resume_at, pause_duration, reverse_at
+    should_pause_this_cycle = False
+    reverse_at = None
+    pause_at = None
+    resume_at = None
+    pause_duration = 0
+
+def start_extending():
+    """
+    Person turned on Christmas while the arm is retracted - start extending
+    Note: Limit switch may be pressed when arm is retracted (normal starting position)
+    """
+    global should_pause_this_cycle, pause_at, resume_at, pause_duration
+    global random_index
+    
+    # Move on to this cycle's pre-drawn random choices (redraw after using them all)
+    random_index = (random_index + 1) & (RANDOM_TABLE_SIZE - 1)
+    if random_index == 0:
+        refill_random_tables()
+    
+    # Decide if we should pause halfway this cycle (random chance)
+    should_pause_this_cycle = pause_decisions[random_index]
+    if DEBUG:
+        if should_pause_this_cycle:
+            print("[GRINCH] Planning a mischievous pause after %.2fs..." % PAUSE_AFTER_TIME)
+        else:
+            print("[GRINCH] No pause planned this cycle - going straight for it!")
+    
+    # Add random delay before starting (makes it more "grinchy" and less predictable)
+    delay_ms = start_delays_ms[random_index]
+    if DEBUG:
+        print("[ACTION] Waiting %.2fs before extending..." % (delay_ms / 1000))
+    # Count the delay from when keypad saw the toggle flip, so the bells and our
+    # own wakeup latency come out of it instead of adding to it
+    wait_ms = ((toggle_edge_at + delay_ms - supervisor.ticks_ms() + TICKS_HALF) & TICKS_MASK) - TICKS_HALF
+    if wait_ms > 0:
+        time.sleep(wait_ms / 1000)
+    if DEBUG:
+        print("[ACTION] Starting extension from retracted position...")
+    
+    # Set the pause deadline from AFTER the delay, when the motor actually starts
+    # This is when the motor PHYSICALLY starts moving, not before
+    if should_pause_this_cycle:
+        pause_at = (supervisor.ticks_ms() + PAUSE_AFTER_MS) & TICKS_MASK
+    else:
+        pause_at = None
+    resume_at = None
+    pause_duration = 0
+    if DEBUG:
+        if should_pause_this_cycle:
+            print("[DEBUG] Motor STARTED moving - will pause after %ss of movement" % PAUSE_AFTER_TIME)
+        else:
+            print("[DEBUG] Motor STARTED moving - no pause planned, going straight to toggle")
+    
+    motor_forward()
+    set_state(EXTENDING)
+
+def start_retracting():
+    """
+    Arm hit the toggle while extending (or paused) - stop, then reverse
+    The main loop reverses the motor once REVERSE_DELAY has passed, so switch
+    edges keep being handled while the motor comes to a stop
+    """
+    global reverse_at
+    if DEBUG:
+        print("[ACTION] Arm hit toggle! Stopping and reversing...")
+    motor_stop()
+    reset_timing()
+    reverse_at = (supervisor.ticks_ms() + REVERSE_DELAY_MS) & TICKS_MASK
+    set_state(REVERSE_PENDING)
+
+def stop_and_idle():
+    """Stop the motor and go back to waiting, whatever we were doing"""
+    motor_stop()
+    set_state(IDLE)
+    reset_timing()
+
+def toggle_action_key(state, is_high):
+    """Key for TOGGLE_ACTIONS - a small int, so building it allocates nothing"""
+    return (state << 1) | is_high
+
+# What to do when the toggle is at a given level in a given state
+# Anything not listed does nothing, e.g. toggle LOW while idle (Christmas is off)
+TOGGLE_ACTIONS = {
+    toggle_action_key(IDLE, True): start_extending,
+    toggle_action_key(EXTENDING, False): start_retracting,
+    toggle_action_key(EXTENDING_PAUSED, False): start_retracting,
+}
+
+def handle_toggle_change(is_high):
+    """
+    Handle toggle switch state change
+    Logic: 
+    - LOW -> HIGH: Person turned on Christmas, start extending
+    - HIGH -> LOW: Arm hit toggle (while extending), reverse direction
+    - LOW: Do nothing (Christmas is off)
+    """
+    if is_high:
+        # Turn on Christmas lights when toggle goes HIGH
+        lights_on()
+        # Play Christmas bells sound
+        play_christmas_bells()
+        if DEBUG:
+            print("[TOGGLE HIGH] Christmas is ON - Grinch is thinking...")
+    else:
+        if DEBUG:
+            print("[TOGGLE LOW] Toggle switch is LOW")
+        # Turn off Christmas lights when toggle goes LOW
+        lights_off()
+        # Play random Grinch voice when Christmas is turned off
+        play_random_grinch_voice()
+    
+    action = TOGGLE_ACTIONS.get(toggle_action_key(current_state, is_high))
+    if action:
+        action()
+
+def handle_microswitch_pressed():
+    """
+    Handle microswitch press
+    Logic: If retracting, stop motor (finger has retracted fully)
+    Note: Limit switch is normally pressed when arm is fully retracted (resting position)
+    """
+    global current_state
+    if DEBUG:
+        print("[MICROSWITCH PRESSED] Limit switch hit")
+    
+    if current_state == RETRACTING:
+        if DEBUG:
+            print("[ACTION] Arm fully retracted, stopping motor")
+        stop_and_idle()
+        if DEBUG:
+            print("[READY] Arm is now in retracted position, ready for next cycle")
+        # Arm is parked, so a collection pause now can't throw off any timing -
+        # better here than letting the automatic one land mid-extension
+        gc.collect()
+    elif current_state == EXTENDING or current_state == EXTENDING_PAUSED:
+        # This shouldn't normally happen, but handle it safely
+        if DEBUG:
+            print("[WARNING] Limit switch pressed while extending - stopping motor")
+        stop_and_idle()
+    else:
+        # Limit switch pressed while idle - this is normal (arm resting against it)
+        # Don't do anything, just log it
+        if current_state == IDLE:
+            if DEBUG:
+                print("[INFO] Limit switch pressed (normal - arm is retracted)")
+        else:
+            if DEBUG:
+                print("[SAFETY] Limit switch pressed unexpectedly, stopping motor")
+            stop_and_idle()
+
+def handle_microswitch_released():
+    """
+    Handle microswitch release
+    Logic: When arm extends, limit switch releases (arm moves away from it)
+    """
+    global current_state
+    if DEBUG:
+        print("[MICROSWITCH RELEASED] Limit switch released (arm extending)")
+    # When limit switch releases during extension, that's expected - don't change state
+    # Only reset if we're in an unexpected state
+    if current_state not in LIMIT_RELEASE_OK_STATES:
+        if DEBUG:
+            print("[RESET] Unexpected state, resetting to IDLE")
+        stop_and_idle()
+
+# ============================================================================
+# Startup
+# ============================================================================
+
+def setup():
+    """
+    One-time startup: print the banner, stop the motor and read the initial switch states
+    Runs as a function so its temporaries are garbage once it returns
+    """
+    if DEBUG:
+        print("=" * 50)
+        print("Useless Box - GPIO & Motor Control")
+        print("=" * 50)
+        print("GPIO 4: Toggle Switch (person flips this)")
+        print("GPIO 5: Microswitch (limit switch - arm position)")
+        print("GPIO 14 & 15: DC Motor Control")
+        print("GPIO 16: Christmas Lights Control")
+        print("GPIO 21: Soundboard IO1 (Christmas bells)")
+        print("GPIO 26, 22, 20, 19: Soundboard IO2-IO5 (Grinch voice)")
+        print("")
+        print("Behavior:")
+        print("  - Toggle LOW: Christmas OFF, do nothing (idle, arm retracted)")
+        print("  - Toggle HIGH: Christmas ON, extend arm forward")
+        print("  - Sometimes pauses halfway, then continues (random mischievous behavior)")
+        print("  - Toggle goes LOW (arm hit it): Reverse until limit switch")
+        print("  - Limit switch pressed (while retracting): Stop and return to idle")
+        print("  - Note: Limit switch is normally PRESSED when arm is retracted")
+        print("")
+        print("Pause probability: %.0f%% (adjust PAUSE_PROBABILITY to change)" % (PAUSE_PROBABILITY * 100))
+        print("")
+        if USE_SPEED_CONTROL:
+            speed_pct = (MOTOR_ON_TIME / (MOTOR_ON_TIME + MOTOR_OFF_TIME)) * 100
+            print("Motor Speed Control: ENABLED (%.0f%% speed)" % speed_pct)
+            print("  Adjust MOTOR_ON_TIME and MOTOR_OFF_TIME to change speed")
+        else:
+            print("Motor Speed Control: DISABLED (full speed)")
+            print("  Set USE_SPEED_CONTROL = True to enable speed control")
+        print("Press Ctrl+C to stop\n")
+
+    # Initialize motor to stopped
+    motor_stop()
+    set_state(IDLE)
+
+    # Draw the first batch of random choices
+    refill_random_tables()
+
+    # Initialize switch states (True = HIGH)
+    # Toggle: HIGH = Christmas ON; microswitch: HIGH = pressed (arm retracted)
+    # keypad starts out assuming every pin is released (HIGH) and queues a "pressed"
+    # event on its first scan for any pin that is already LOW. Drain those events
+    # to learn the starting levels without running the change handlers.
+    toggle_state = True
+    microswitch_state = True
+    time.sleep(0.1)  # Give keypad time for its first scan
+    event = switches.events.get()
+    while event:
+        if event.key_number == TOGGLE_KEY:
+            toggle_state = event.released
+        else:
+            microswitch_state = event.released
+        event = switches.events.get()
+
+    # Initialize Christmas lights to match initial toggle state
+    if toggle_state:
+        lights_on()
+    else:
+        lights_off()
+
+    # Debug: Print initial switch states
+    if DEBUG:
+        print("[INIT] Toggle switch: %s" % ("HIGH" if toggle_state else "LOW"))
+        print("[INIT] Limit switch: %s" % ("PRESSED" if microswitch_state else "RELEASED"))
+        print("[INIT] Raw microswitch value: %s (True=HIGH/released, False=LOW/pressed)" % microswitch_state)
+        print("[INIT] With pull-up, LOW (False) = pressed, HIGH (True) = released")
+        print("")
+
+setup()
+del setup  # Only needed once - drop it so its bytecode can be collected too
+
+# ============================================================================
+# Main Loop
+# ============================================================================
+
+def main():
+    """Run the useless box forever"""
+    global should_pause_this_cycle, pause_at, resume_at, pause_duration, reverse_at
+    global next_debug_at, toggle_edge_at
+    
+    # Bind everything the loop calls to locals once, so each use is a fast
+    # local load instead of a global dict lookup (plus an attribute lookup)
+    get_event_into = switches.events.get_into
+    ticks_ms = supervisor.ticks_ms
+    sleep = time.sleep
+    stop = motor_stop
+    forward = motor_forward
+    reverse = motor_reverse
+    change_state = set_state
+    on_toggle = handle_toggle_change
+    on_limit_pressed = handle_microswitch_pressed
+    on_limit_released = handle_microswitch_released
+    
+    # Every edge is read into this one Event, so handling an edge allocates nothing
+    event = keypad.Event()
+    
+    # Compact the heap left over from startup before settling into the loop
+    gc.collect()
+    
+    while True:
+        # Handle every switch edge keypad queued while we slept (released = pin went HIGH)
+        # These edges are the only source of switch state - nothing reads the pins
+        while get_event_into(event):
+            if event.key_number == TOGGLE_KEY:
+                toggle_edge_at = event.timestamp
+                on_toggle(event.released)
+            else:
+                if event.released:
+                    on_limit_pressed()
+                else:
+                    # Safety check: limit switch released unexpectedly while retracting
+                    if DEBUG and current_state == RETRACTING:
+                        # This shouldn't happen normally, but handle it gracefully
+                        print("[WARNING] Limit switch released while retracting - continuing...")
+                    on_limit_released()
+    
+        # Read the state once - the checks below are for mutually exclusive
+        # states, so at most one of them runs per pass
+        state = current_state
+    
+        # Idle: nothing to time, so just nap until the next switch edge arrives
+        if state == IDLE:
+            sleep(IDLE_LOOP_DELAY)
+            continue
+    
+        # Wake for the next keypad scan, or sooner if a pause or reversal is due
+        wake_in = LOOP_DELAY_MS
+    
+        # Check for pause during extension (random mischievous behavior)
+        # This happens DURING the extending action, not before it starts
+        if state == EXTENDING and pause_at is not None:
+            until_pause = ((pause_at - ticks_ms() + TICKS_HALF) & TICKS_MASK) - TICKS_HALF
+        
+            if until_pause <= 0:
+                # Time to pause! Stop motor and enter pause state
+                if DEBUG:
+                    print("[GRINCH] *** PAUSING DURING EXTENSION *** (motor ran for %.3fs)" % ((PAUSE_AFTER_MS - until_pause) / 1000))
+                stop()  # IMPORTANT: Actually stop the motor!
+                pause_duration = pause_durations_ms[random_index]
+                resume_at = (ticks_ms() + pause_duration) & TICKS_MASK
+                if DEBUG:
+                    next_debug_at = (ticks_ms() + 500) & TICKS_MASK
+                    print("[GRINCH] Motor STOPPED - pausing for %.2fs, then will continue extending..." % (pause_duration / 1000))
+                change_state(EXTENDING_PAUSED)
+                should_pause_this_cycle = False  # Only pause once per cycle
+                pause_at = None
+            elif until_pause < wake_in:
+                wake_in = until_pause
+    
+        # Handle pause state - wait, then resume extending
+        # The motor was stopped once on entering the pause - nothing re-stops it here
+        elif state == EXTENDING_PAUSED:
+            if resume_at is not None and pause_duration > 0:
+                remaining = ((resume_at - ticks_ms() + TICKS_HALF) & TICKS_MASK) - TICKS_HALF
+                elapsed_pause = pause_duration - remaining
+                if remaining > 0:
+                    # Still pausing - motor should be stopped
+                    if remaining < wake_in:
+                        wake_in = remaining
+                    # Debug every 0.5s to show we're still paused
+                    if DEBUG and ((next_debug_at - ticks_ms() + TICKS_HALF) & TICKS_MASK) - TICKS_HALF <= 0:
+                        print("[GRINCH] Still paused... %.2fs remaining" % (remaining / 1000))
+                        next_debug_at = (next_debug_at + 500) & TICKS_MASK
+                else:
+                    # Pause complete, resume extending
+                    if DEBUG:
+                        print("[GRINCH] *** RESUMING *** (paused for %.2fs)" % (elapsed_pause / 1000))
+                    forward()
+                    change_state(EXTENDING)
+                    resume_at = None
+                    pause_duration = 0
+            else:
+                # Safety: if we're in pause state but timing isn't set, something went wrong
+                if DEBUG:
+                    print("[WARNING] Pause state but no timing set - resuming...")
+                forward()
+                change_state(EXTENDING)
+                resume_at = None
+                pause_duration = 0
+    
+        # Motor has had its moment to stop after hitting the toggle - reverse it now
+        elif state == REVERSE_PENDING:
+            until_reverse = ((reverse_at - ticks_ms() + TICKS_HALF) & TICKS_MASK) - TICKS_HALF
+            if until_reverse <= 0:
+                reverse()
+                change_state(RETRACTING)
+                reverse_at = None
+            elif until_reverse < wake_in:
+                wake_in = until_reverse
+    
+        # Switch edges keep queuing in keypad while we sleep
+        sleep(wake_in / 1000)
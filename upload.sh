@@ -16,6 +16,13 @@ if [ ! -d "$CIRCUITPY" ]; then
     fi
 fi
 
-echo "Uploading code.py to $CIRCUITPY..."
+MPY_CROSS="${MPY_CROSS:-mpy-cross}"
+
+echo "Compiling grinch.py to grinch.mpy..."
+"$MPY_CROSS" -O3 grinch.py || exit 1
+
+echo "Uploading code.py and grinch.mpy to $CIRCUITPY..."
+rm -f "$CIRCUITPY/grinch.py"
+cp grinch.mpy "$CIRCUITPY/grinch.mpy"
 cp code.py "$CIRCUITPY/code.py"
 echo "✓ Upload complete!"